@@ -31,8 +31,8 @@ export async function submitGeneration(
   onProgress?: (event: ProgressEvent) => void,
 ): Promise<GenerationResult> {
   const formData = new FormData();
-  formData.append("eventName", data.eventName);
-  formData.append("prompt", data.prompt);
+  formData.append("eventName", data.eventName.trim());
+  formData.append("prompt", data.prompt.trim());
   formData.append("inspirationImages", JSON.stringify(data.inspirationImages));
 
   for (const file of data.clientFiles) {